@@ -1,14 +1,33 @@
-import re
+import string
 from typing import Dict, Optional
 
 import arrow
 import click
 import requests
+from requests.adapters import HTTPAdapter
 
 from lightning_app.core.constants import APP_SERVER_PORT
 from lightning_app.utilities.cloud import _get_project
+from lightning_app.utilities.exceptions import CommandsUnavailable
 from lightning_app.utilities.network import LightningClient
 
+# translating a valid name through this table deletes every character, leaving an empty string
+_ENV_VAR_NAME_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_")
+# (connect, read) timeouts in seconds so an unresponsive app server can't stall the CLI indefinitely
+_REQUEST_TIMEOUT = (3.05, 10)
+
+
+def _configure_session() -> requests.Session:
+    """Configures a session whose pooled connections are reused across the CLI requests to the same host."""
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    http = requests.Session()
+    http.mount("https://", adapter)
+    http.mount("http://", adapter)
+    return http
+
+
+_SESSION = _configure_session()
+
 
 def _format_input_env_variables(env_list: tuple) -> Dict[str, str]:
     """
@@ -24,31 +43,29 @@ def _format_input_env_variables(env_list: tuple) -> Dict[str, str]:
 
     env_vars_dict = {}
     for env_str in env_list:
-        var_parts = env_str.split("=")
-        if len(var_parts) != 2 or not var_parts[0]:
+        var_name, sep, value = env_str.partition("=")
+        if not sep or not var_name:
             raise Exception(
                 f"Invalid format of environment variable {env_str}, "
                 f"please ensure that the variable is in the format e.g. foo=bar."
             )
-        var_name, value = var_parts
 
-        if var_name in env_vars_dict:
-            raise Exception(f"Environment variable '{var_name}' is duplicated. Please only include it once.")
-
-        if not re.match(r"[0-9a-zA-Z_]+", var_name):
+        if var_name.translate(_ENV_VAR_NAME_TABLE):
             raise ValueError(
                 f"Environment variable '{var_name}' is not a valid name. It is only allowed to contain digits 0-9, "
                 f"letters A-Z, a-z and _ (underscore)."
             )
 
+        # a single insertion detects duplicates: the dict only grows when the name is new
+        num_env_vars = len(env_vars_dict)
         env_vars_dict[var_name] = value
+        if len(env_vars_dict) == num_env_vars:
+            raise Exception(f"Environment variable '{var_name}' is duplicated. Please only include it once.")
     return env_vars_dict
 
 
 def _is_url(id: Optional[str]) -> bool:
-    if isinstance(id, str) and (id.startswith("https://") or id.startswith("http://")):
-        return True
-    return False
+    return isinstance(id, str) and id.startswith(("https://", "http://"))
 
 
 def _get_metadata_from_openapi(paths: Dict, path: str):
@@ -83,20 +100,26 @@ def _retrieve_application_url_and_available_commands(app_id_or_name_or_url: Opti
     if _is_url(app_id_or_name_or_url):
         url = app_id_or_name_or_url
         assert url
-        resp = requests.get(url + "/openapi.json")
+        resp = _SESSION.get(url + "/openapi.json", timeout=_REQUEST_TIMEOUT)
         if resp.status_code != 200:
-            raise Exception(f"The server didn't process the request properly. Found {resp.json()}")
+            raise CommandsUnavailable(
+                "The server didn't process the request properly. "
+                f"Found HTTP {resp.status_code}: {resp.text[:512]!r}"
+            )
         return url, _extract_command_from_openapi(resp.json()), None
 
     # 2: If no identifier has been provided, evaluate the local application
     if app_id_or_name_or_url is None:
         try:
             url = f"http://localhost:{APP_SERVER_PORT}"
-            resp = requests.get(f"{url}/openapi.json")
+            resp = _SESSION.get(f"{url}/openapi.json", timeout=_REQUEST_TIMEOUT)
             if resp.status_code != 200:
-                raise Exception(f"The server didn't process the request properly. Found {resp.json()}")
+                raise CommandsUnavailable(
+                    "The server didn't process the request properly. "
+                    f"Found HTTP {resp.status_code}: {resp.text[:512]!r}"
+                )
             return url, _extract_command_from_openapi(resp.json()), None
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             pass
 
     # 3: If an identified was provided or the local evaluation has failed, evaluate the cloud.
@@ -107,18 +130,17 @@ def _retrieve_application_url_and_available_commands(app_id_or_name_or_url: Opti
             project_id=project.project_id
         )
 
-        lightningapp_names = [lightningapp.name for lightningapp in list_lightningapps.lightningapps]
-
         if not app_id_or_name_or_url:
+            lightningapp_names = [lightningapp.name for lightningapp in list_lightningapps.lightningapps]
             raise Exception(f"Provide an application name, id or url with --app_id=X. Found {lightningapp_names}")
 
         for lightningapp in list_lightningapps.lightningapps:
             if lightningapp.id == app_id_or_name_or_url or lightningapp.name == app_id_or_name_or_url:
                 if lightningapp.status.url == "":
                     raise Exception("The application is starting. Try in a few moments.")
-                resp = requests.get(lightningapp.status.url + "/openapi.json")
+                resp = _SESSION.get(lightningapp.status.url + "/openapi.json", timeout=_REQUEST_TIMEOUT)
                 if resp.status_code != 200:
-                    raise Exception(
+                    raise CommandsUnavailable(
                         "The server didn't process the request properly. " "Try once your application is ready."
                     )
                 return lightningapp.status.url, _extract_command_from_openapi(resp.json()), lightningapp.id
@@ -62,3 +62,7 @@ class LightningSigtermStateException(Exception):
 
 class LogLinesLimitExceeded(Exception):
     """Exception to inform the user that we've reached the maximum number of log lines."""
+
+
+class CommandsUnavailable(RuntimeError):
+    """Exception to inform the user that the commands of a LightningApp couldn't be retrieved from its server."""
@@ -11,7 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Callable, Dict, List, Mapping, Optional, OrderedDict, TYPE_CHECKING, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, OrderedDict, Type, TYPE_CHECKING, Union
 
 import torch
 from lightning_utilities.core.imports import RequirementCache
@@ -44,6 +45,23 @@ else:
     ColoInitContext = Any
 
 
+@lru_cache(1)
+def _model_sharded_context_cls() -> Type["ColoInitContext"]:
+    """Creates the ``ColoInitContext`` subclass once, deferring the ``colossalai`` import to the first call."""
+    with _patch_cuda_is_available():
+        from colossalai.utils.model.colo_init_context import ColoInitContext
+
+    class ModelShardedContext(ColoInitContext):
+        def _post_init_method(self, module: torch.nn.Module, *args: Any, **kwargs: Any) -> None:
+            # the tag below is a plain attribute, which `nn.Module` keeps in the instance `__dict__`
+            if module.__dict__.get("_colossalai_module", False):
+                return
+            super()._post_init_method(module, *args, **kwargs)
+            module._colossalai_module = True  # type: ignore[assignment]
+
+    return ModelShardedContext
+
+
 class ColossalAIStrategy(DDPStrategy):
     """ColossalAI strategy. It only supports a single optimizer, which must be
     :class:`colossalai.nn.optimizer.CPUAdam` or :class:`colossalai.nn.optimizer.HybridAdam` now. Your model must
@@ -166,11 +184,15 @@ class ColossalAIStrategy(DDPStrategy):
         self.placement_policy = placement_policy
         self.force_outputs_fp32 = force_outputs_fp32
         self.gpu_margin_mem_ratio = gpu_margin_mem_ratio
-        self.chunk_size_search_kwargs = {
-            "search_range": chunk_search_range,
-            "n_grids": chunk_search_n_grids,
-            "min_chunk_size": min_chunk_size,
-        }
+        self.chunk_size_search_kwargs = (
+            {
+                "search_range": chunk_search_range,
+                "n_grids": chunk_search_n_grids,
+                "min_chunk_size": min_chunk_size,
+            }
+            if use_chunk
+            else None
+        )
         self.amp_kwargs = {
             "initial_scale": initial_scale,
             "min_scale": min_scale,
@@ -185,11 +207,12 @@ class ColossalAIStrategy(DDPStrategy):
 
     @property
     def root_device(self) -> torch.device:
+        if self.parallel_devices is not None:
+            return self.parallel_devices[self.local_rank]
+
         with _patch_cuda_is_available():
             from colossalai.utils import get_current_device
 
-        if self.parallel_devices is not None:
-            return self.parallel_devices[self.local_rank]
         return get_current_device()
 
     @property
@@ -228,17 +251,7 @@ class ColossalAIStrategy(DDPStrategy):
 
         Returns: Model parallel context.
         """
-        with _patch_cuda_is_available():
-            from colossalai.utils.model.colo_init_context import ColoInitContext
-
-        class ModelShardedContext(ColoInitContext):
-            def _post_init_method(self, module: torch.nn.Module, *args: Any, **kwargs: Any) -> None:
-                if getattr(module, "_colossalai_module", False) is True:
-                    return
-                super()._post_init_method(module, *args, **kwargs)
-                module._colossalai_module = True  # type: ignore[assignment]
-
-        return ModelShardedContext()
+        return _model_sharded_context_cls()()
 
     def setup_precision_plugin(self) -> None:
         with _patch_cuda_is_available():
@@ -249,8 +262,9 @@ class ColossalAIStrategy(DDPStrategy):
             from colossalai.zero import ZeroOptimizer
 
         super().setup_precision_plugin()
-        assert self.lightning_module is not None
-        is_training = self.lightning_module.trainer and self.lightning_module.trainer.training
+        lightning_module = self.lightning_module
+        assert lightning_module is not None
+        is_training = lightning_module.trainer and lightning_module.trainer.training
 
         if is_training:
             if len(self.optimizers) > 1:
@@ -266,6 +280,7 @@ class ColossalAIStrategy(DDPStrategy):
         process_group = ProcessGroup()
         if not hasattr(pl_module, "_colossalai_zero"):
             if self.use_chunk:
+                assert self.chunk_size_search_kwargs is not None
                 chunk_size = self.chunk_size or ChunkManager.search_chunk_size(
                     self.model, **self.chunk_size_search_kwargs
                 )
@@ -335,9 +350,11 @@ class ColossalAIStrategy(DDPStrategy):
     def model_to_device(self) -> None:
         assert self.lightning_module is not None
         pl_module = self.lightning_module
+        root_device = self.root_device
         for child in pl_module.modules():
-            if child is not pl_module and not getattr(child, "_colossalai_module", False):
-                child.to(self.root_device)
+            # read the instance dict directly: a `getattr` miss goes through `Module.__getattr__` and raises
+            if child is not pl_module and not child.__dict__.get("_colossalai_module", False):
+                child.to(root_device)
 
     def teardown(self) -> None:
         optimizers = self.optimizers
@@ -388,11 +405,9 @@ class ColossalAIStrategy(DDPStrategy):
         prefix += "."
         assert child is self.lightning_module
 
-        mapping_dict = dict()
-        for key in org_dict.keys():
-            mapping_dict[key] = key.replace(prefix, "")  # remove "_forward_module." from the key
-
-        return {mapping_dict[key]: value for key, value in org_dict.items()}
+        # remove "_forward_module." from the key
+        prefix_len = len(prefix)
+        return {(key[prefix_len:] if key.startswith(prefix) else key): value for key, value in org_dict.items()}
 
     def load_model_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
         orig_dict = checkpoint["state_dict"]
@@ -404,11 +419,8 @@ class ColossalAIStrategy(DDPStrategy):
         prefix += "."
         assert child is self.lightning_module
 
-        mapping_dict = dict()
-        for key in orig_dict.keys():
-            mapping_dict[key] = prefix + key  # add "_forward_module." to the key
-
-        load_dict = OrderedDict({mapping_dict[key]: value for key, value in orig_dict.items()})
+        # add "_forward_module." to the key
+        load_dict = OrderedDict((prefix + key, value) for key, value in orig_dict.items())
         self.model.load_state_dict(load_dict)
 
     def validation_step(self, *args: Any, **kwargs: Any) -> Optional[STEP_OUTPUT]:
@@ -45,6 +45,7 @@ def test_connect_disconnect_local(monkeypatch):
     response.status_code = 200
     response.json.return_value = data
     monkeypatch.setattr(requests, "get", MagicMock(return_value=response))
+    monkeypatch.setattr(cli_helpers._SESSION, "get", MagicMock(return_value=response))
     connect("localhost", True)
     assert _retrieve_connection_to_an_app() == ("localhost", None)
     commands = _list_app_commands()
@@ -115,6 +116,7 @@ def test_connect_disconnect_cloud(monkeypatch):
     response.status_code = 200
     response.json.return_value = data
     monkeypatch.setattr(requests, "get", MagicMock(return_value=response))
+    monkeypatch.setattr(cli_helpers._SESSION, "get", MagicMock(return_value=response))
     project = MagicMock()
     project.project_id = "custom_project_name"
     monkeypatch.setattr(cli_helpers, "_get_project", MagicMock(return_value=project))
@@ -2,8 +2,15 @@ from unittest.mock import Mock
 
 import arrow
 import pytest
+import requests
 
-from lightning_app.utilities.cli_helpers import _arrow_time_callback, _format_input_env_variables
+from lightning_app.utilities import cli_helpers
+from lightning_app.utilities.cli_helpers import (
+    _arrow_time_callback,
+    _format_input_env_variables,
+    _retrieve_application_url_and_available_commands,
+)
+from lightning_app.utilities.exceptions import CommandsUnavailable
 
 
 def test_format_input_env_variables():
@@ -24,14 +31,75 @@ def test_format_input_env_variables():
             )
         )
 
+    with pytest.raises(Exception, match="is duplicated. Please only include it once."):
+        _format_input_env_variables(("FOO=", "FOO="))
+
     with pytest.raises(
         Exception,
         match="is not a valid name. It is only allowed to contain digits 0-9, letters A-Z",
     ):
         _format_input_env_variables(("*FOO#=bar",))
 
+    with pytest.raises(
+        Exception,
+        match="is not a valid name. It is only allowed to contain digits 0-9, letters A-Z",
+    ):
+        _format_input_env_variables(("FOO$=bar",))
+
     assert _format_input_env_variables(("FOO=bar", "BLA=bloz")) == {"FOO": "bar", "BLA": "bloz"}
 
+    assert _format_input_env_variables(("FOO=bar=", "BLA=a=b")) == {"FOO": "bar=", "BLA": "a=b"}
+
+
+def _mock_cloud_app(monkeypatch):
+    app = Mock()
+    app.name = "example"
+    app.id = "1234"
+    app.status.url = "https://example.lightning.ai"
+    client = Mock()
+    client.lightningapp_instance_service_list_lightningapp_instances.return_value.lightningapps = [app]
+    monkeypatch.setattr(cli_helpers, "_get_project", Mock())
+    monkeypatch.setattr(cli_helpers, "LightningClient", Mock(return_value=client))
+
+
+def test_retrieve_application_url_and_available_commands_unavailable(monkeypatch):
+    response = Mock()
+    response.status_code = 500
+    response.text = "<html>Internal Server Error</html>"
+    monkeypatch.setattr(cli_helpers._SESSION, "get", Mock(return_value=response))
+
+    with pytest.raises(CommandsUnavailable, match="Found HTTP 500: '<html>Internal Server Error</html>'"):
+        _retrieve_application_url_and_available_commands("http://localhost:7501")
+
+    _mock_cloud_app(monkeypatch)
+
+    with pytest.raises(CommandsUnavailable, match="Try once your application is ready."):
+        _retrieve_application_url_and_available_commands("example")
+
+
+def test_retrieve_application_url_and_available_commands_timeout(monkeypatch):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"paths": {}}
+
+    def get(url, **kwargs):
+        if url.startswith("http://localhost"):
+            raise requests.exceptions.ReadTimeout()
+        return response
+
+    session_get = Mock(side_effect=get)
+    monkeypatch.setattr(cli_helpers._SESSION, "get", session_get)
+
+    _mock_cloud_app(monkeypatch)
+
+    # an unresponsive local server no longer stalls or crashes the lookup
+    assert _retrieve_application_url_and_available_commands(None) == (None, None, None)
+    assert _retrieve_application_url_and_available_commands("example") == ("https://example.lightning.ai", {}, "1234")
+
+    assert session_get.call_count == 2
+    for call in session_get.call_args_list:
+        assert call.kwargs["timeout"] == cli_helpers._REQUEST_TIMEOUT
+
 
 def test_arrow_time_callback():
     # Check ISO 8601 variations
@@ -166,6 +166,52 @@ def test_warn_colossalai_ignored(tmpdir):
     assert any("track_grad_norm=2.0)' but this is not supported" in w for w in warning_cache)
 
 
+class PrefixCollisionBoringModel(ModelParallelBoringModel):
+    def configure_sharded_model(self) -> None:
+        super().configure_sharded_model()
+        # its parameter keys contain the "_forward_module." wrapper prefix in the middle
+        self.inner_forward_module = torch.nn.Linear(2, 2)
+
+    def forward(self, x):
+        return self.inner_forward_module(self.layer(x))
+
+    def configure_optimizers(self):
+        return HybridAdam(self.parameters(), lr=1e-3)
+
+
+@RunIf(min_cuda_gpus=1, colossalai=True)
+def test_colossalai_state_dict_keys_containing_wrapper_prefix(tmpdir):
+    model = PrefixCollisionBoringModel()
+    trainer = Trainer(
+        fast_dev_run=True,
+        default_root_dir=tmpdir,
+        accelerator="gpu",
+        devices=1,
+        precision=16,
+        strategy="colossalai",
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    trainer.fit(model)
+
+    checkpoint_path = os.path.join(tmpdir, "model.ckpt")
+    trainer.save_checkpoint(checkpoint_path)
+    state_dict = torch.load(checkpoint_path)["state_dict"]
+    assert set(state_dict) == {
+        "layer.weight",
+        "layer.bias",
+        "inner_forward_module.weight",
+        "inner_forward_module.bias",
+    }
+
+    new_state_dict = {key: value + 1 for key, value in state_dict.items()}
+    trainer.strategy.load_model_state_dict({"state_dict": new_state_dict})
+    loaded_state_dict = trainer.strategy.lightning_module_state_dict()
+    assert set(loaded_state_dict) == set(new_state_dict)
+    for key, value in new_state_dict.items():
+        torch.testing.assert_close(loaded_state_dict[key].float().cpu(), value.float().cpu(), atol=1e-3, rtol=1e-3)
+
+
 def _assert_save_model_is_equal(model, tmpdir, trainer):
     checkpoint_path = os.path.join(tmpdir, "model.pt")
     checkpoint_path = trainer.strategy.broadcast(checkpoint_path)